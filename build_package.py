@@ -1,12 +1,34 @@
+import concurrent.futures
 import os
-import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import tomllib
 import zipfile
+import zlib
+
+from build_utils import build_all, fastcopy
+
+# zip entries need CRC-32/IEEE, so CRC-32C is not an option. zlib-ng computes
+# the same checksum with SIMD acceleration; use it when it is installed.
+try:
+    from zlib_ng import zlib_ng
+
+    zipfile.crc32 = zlib_ng.crc32
+except ImportError:
+    pass
 
 g_dev_mode = False
 
+# entries whose first 64 KiB do not shrink below 95% under fast deflate are
+# stored as-is; the payload is already compressed and deflate only costs CPU
+PROBE_SIZE = 64 * 1024
+PROBE_STORE_RATIO = 0.95
+
+ZIP_BUFFER_SIZE = 1024 * 1024
+
 
 def get_commit_id_short():
     try:
@@ -23,19 +45,83 @@ def get_commit_id_short():
         return None
 
 
+def iter_files(root):
+    """Yield (path, relative path with "/" separators) for every file under root.
+
+    Uses an explicit stack over os.scandir, depth-first, without following symlinks.
+    """
+    prefix_len = len(root) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        dirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.path[prefix_len:].replace("\\", "/")
+        stack.extend(reversed(dirs))
+
+
+def get_compress_type(path):
+    with open(path, "rb") as f:
+        sample = f.read(PROBE_SIZE)
+    if sample and len(zlib.compress(sample, 1)) >= PROBE_STORE_RATIO * len(sample):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def remove_trash_dir(trash_dir):
+    def on_exc(func, path, exc):
+        print(f"Error: failed to remove {path}: {exc}")
+
+    def on_error(func, path, exc_info):
+        on_exc(func, path, exc_info[1])
+
+    # onerror is deprecated since Python 3.12 in favour of onexc
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(trash_dir, onexc=on_exc)
+    else:
+        shutil.rmtree(trash_dir, onerror=on_error)
+    if os.path.exists(trash_dir):
+        print(
+            f"Error: could not remove old dist folder {trash_dir}, delete it manually"
+        )
+
+
+def stage(src_dst):
+    if src_dst["type"] == "file":
+        dst = "./dist/" + src_dst["dst"]
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        fastcopy(src_dst["src"], dst)
+    elif src_dst["type"] == "dir":
+        shutil.copytree(
+            src_dst["src"],
+            "./dist/" + src_dst["dst"],
+            copy_function=fastcopy,
+            dirs_exist_ok=True,
+        )
+    elif src_dst["type"] == "create_dir":
+        os.makedirs("./dist/" + src_dst["dst"], exist_ok=True)
+
+
 if len(sys.argv) >= 2:
     if sys.argv[1] == "dev":
         g_dev_mode = True
 
-# create dist folder
+# create dist folder, moving the old one aside and deleting it in the
+# background so the deletion overlaps with the build
+trash_thread = None
 if os.path.exists("dist"):
-    shutil.rmtree("dist")
+    trash_dir = tempfile.mkdtemp(prefix="dist_old_", dir=".")
+    os.replace("dist", os.path.join(trash_dir, "dist"))
+    trash_thread = threading.Thread(target=remove_trash_dir, args=(trash_dir,))
+    trash_thread.start()
 
 os.makedirs("dist")
 
-# run build command
-os.system("cd hid && xmake build -y")
-os.system("cargo build --release --package lua-framework --package luaf-libffi")
+build_all()
 
 file_src_dst = [
     # loader
@@ -80,24 +166,13 @@ file_src_dst = [
     },
 ]
 
-for src_dst in file_src_dst:
-    if src_dst["type"] == "file":
-        dst = "./dist/" + src_dst["dst"]
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
-        shutil.copy(src_dst["src"], dst)
-    elif src_dst["type"] == "dir":
-        shutil.copytree(src_dst["src"], "./dist/" + src_dst["dst"])
-    elif src_dst["type"] == "create_dir":
-        os.makedirs("./dist/" + src_dst["dst"])
+# stage the entries in parallel; they go to separate paths under dist/
+with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(stage, file_src_dst))
 
 # get version from Cargo.toml
-version = ""
-with open("Cargo.toml", "r", encoding="utf-8") as f:
-    for line in f:
-        if line.startswith("version"):
-            results = re.findall(r'version = "(\d+\.\d+\.\d+)"', line)
-            if len(results) > 0:
-                version = results[0]
+with open("Cargo.toml", "rb") as f:
+    version = tomllib.load(f)["package"]["version"]
 
 zip_name = None
 if g_dev_mode:
@@ -107,22 +182,37 @@ else:
     zip_name = f"lua-framework_v{version}.zip"
 
 # create zip file
-archive = zipfile.ZipFile(f"dist/{zip_name}", "w", zipfile.ZIP_DEFLATED)
+# dev archives are throwaway, trade a little size for much less CPU time
+compress_level = 1 if g_dev_mode else 6
+# write through a 1 MiB buffer instead of the default 8 KiB one
+zip_file = open(f"dist/{zip_name}", "wb", buffering=ZIP_BUFFER_SIZE)
+archive = zipfile.ZipFile(
+    zip_file, "w", zipfile.ZIP_DEFLATED, compresslevel=compress_level
+)
 
+# read from the staged copies in dist/ instead of the original sources,
+# so every source file is only read from disk once
 for src_dst in file_src_dst:
     if src_dst["type"] == "file":
-        archive.write(src_dst["src"], src_dst["dst"])
+        archive.write(
+            "./dist/" + src_dst["dst"],
+            src_dst["dst"],
+            compress_type=get_compress_type("./dist/" + src_dst["dst"]),
+        )
     elif src_dst["type"] == "dir":
-        for root, dirs, files in os.walk(src_dst["src"]):
-            for file in files:
-                archive.write(
-                    os.path.join(root, file),
-                    os.path.join(
-                        src_dst["dst"],
-                        os.path.relpath(os.path.join(root, file), src_dst["src"]),
-                    ),
-                )
+        # the script tree is 16 files (about 31 KiB); compressing them in a
+        # process pool would cost more in worker startup than it saves
+        for path, rel_path in iter_files("./dist/" + src_dst["dst"]):
+            archive.write(
+                path,
+                src_dst["dst"] + "/" + rel_path,
+                compress_type=get_compress_type(path),
+            )
     elif src_dst["type"] == "create_dir":
         archive.mkdir(src_dst["dst"])
 
 archive.close()
+zip_file.close()
+
+if trash_thread is not None:
+    trash_thread.join()
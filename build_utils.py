@@ -0,0 +1,105 @@
+import os
+import shutil
+import subprocess
+import sys
+import zlib
+
+COPY_CHUNK_SIZE = 1024 * 1024
+SAMPLE_SIZE = 64 * 1024
+
+XMAKE_BUILD_CMD = ["xmake", "build", "-y"]
+# build every package in a single cargo session so the dependency graph is
+# resolved only once
+CARGO_BUILD_CMD = [
+    "cargo",
+    "build",
+    "--release",
+    "--package",
+    "lua-framework",
+    "--package",
+    "luaf-libffi",
+]
+
+
+def build_all():
+    """Run the independent xmake and cargo builds concurrently."""
+    p_xmake = subprocess.Popen(XMAKE_BUILD_CMD, cwd="hid")
+    p_cargo = subprocess.Popen(CARGO_BUILD_CMD)
+    rc_xmake, rc_cargo = p_xmake.wait(), p_cargo.wait()
+    if rc_xmake != 0:
+        raise subprocess.CalledProcessError(rc_xmake, XMAKE_BUILD_CMD)
+    if rc_cargo != 0:
+        raise subprocess.CalledProcessError(rc_cargo, CARGO_BUILD_CMD)
+
+
+def _fastcopy_windows(src, dst):
+    import ctypes
+
+    cancel = ctypes.c_int(0)
+    if not ctypes.windll.kernel32.CopyFileExW(
+        str(src), str(dst), None, None, ctypes.byref(cancel), 0
+    ):
+        raise ctypes.WinError()
+
+
+def _fastcopy_posix(src, dst):
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(
+                    fdst.fileno(), fsrc.fileno(), offset, COPY_CHUNK_SIZE
+                )
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # sendfile is unavailable or does not support regular files here
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def fastcopy(src, dst):
+    """Copy src to dst with its timestamps (and file attributes on Windows)."""
+    if sys.platform == "win32":
+        _fastcopy_windows(src, dst)
+    else:
+        _fastcopy_posix(src, dst)
+    return dst
+
+
+def _sample_crc32(path, size):
+    with open(path, "rb") as f:
+        crc = zlib.crc32(f.read(SAMPLE_SIZE))
+        if size > SAMPLE_SIZE:
+            f.seek(max(SAMPLE_SIZE, size - SAMPLE_SIZE))
+            crc = zlib.crc32(f.read(SAMPLE_SIZE), crc)
+    return crc
+
+
+def is_up_to_date(src, dst):
+    """Check whether dst already holds the same content as src."""
+    try:
+        s, d = os.stat(src), os.stat(dst)
+    except FileNotFoundError:
+        return False
+    if s.st_size != d.st_size:
+        return False
+    if int(s.st_mtime) < int(d.st_mtime):
+        return True
+    if int(s.st_mtime) > int(d.st_mtime):
+        return False
+    return _sample_crc32(src, s.st_size) == _sample_crc32(dst, d.st_size)
+
+
+def copy_if_changed(src, dst):
+    """fastcopy src to dst unless it is up to date; return whether it copied."""
+    if is_up_to_date(src, dst):
+        return False
+    fastcopy(src, dst)
+    return True
@@ -1,25 +1,29 @@
-import os
+import concurrent.futures
 import pathlib
-import shutil
-
-game_root = pathlib.Path("C:/Program Files (x86)/Steam/steamapps/common/Monster Hunter World")
-
-os.system("cd hid && xmake build -y")
-os.system("cargo build --release --package lua-framework --package luaf-libffi")
-
-shutil.copy(
-    "hid/build/windows/x64/release/hid.dll",
-    game_root.joinpath("hid.dll"),
-)
-shutil.copy(
-    "target/release/lua_framework.dll",
-    game_root.joinpath("lua_framework.dll"),
-)
-shutil.copy(
-    "target/release/luaf_libffi.dll",
-    game_root.joinpath("lua_framework/extensions/luaf_libffi.dll"),
-)
-shutil.copy(
-    "mhw-imgui-core/x64/Release/mhw-imgui-core.dll",
-    game_root.joinpath("lua_framework/extensions/mhw-imgui-core.dll"),
-)
+
+from build_utils import build_all, copy_if_changed
+
+game_root = pathlib.Path(r"C:\Program Files (x86)\Steam\steamapps\common\Monster Hunter World")
+
+build_all()
+
+# (build output, path relative to the game root)
+DEPLOY = [
+    (r"hid\build\windows\x64\release\hid.dll", "hid.dll"),
+    (r"target\release\lua_framework.dll", "lua_framework.dll"),
+    (r"target\release\luaf_libffi.dll", r"lua_framework\extensions\luaf_libffi.dll"),
+    (
+        r"mhw-imgui-core\x64\Release\mhw-imgui-core.dll",
+        r"lua_framework\extensions\mhw-imgui-core.dll",
+    ),
+]
+
+
+def deploy(src_dst):
+    src, dst = src_dst
+    copy_if_changed(src, str(game_root / dst))
+
+
+# each DLL goes to its own path in the game folder, deploy them in parallel
+with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(deploy, DEPLOY))
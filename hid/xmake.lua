@@ -2,10 +2,40 @@ set_project("hid_forward")
 
 add_requires("wil")
 
+-- generate the export forwarders from <target>.dll.ExportFunctions.txt
+rule("export_forward")
+    on_load(function (target)
+        target:add("includedirs", target:autogendir())
+    end)
+
+    before_build(function (target)
+        local module_name = target:name()
+        local input = path.join(os.scriptdir(), module_name .. ".dll.ExportFunctions.txt")
+        local output = path.join(target:autogendir(), "export_forward.h")
+        -- regenerate when either the export list or this script changes
+        local newest = math.max(os.mtime(input), os.mtime(os.scriptfile()))
+        if os.isfile(output) and os.mtime(output) >= newest then
+            return
+        end
+
+        local template = [[#pragma comment(linker, "/export:%s=\"C:\\Windows\\System32\\%s.%s\"")]]
+        local lines = {}
+        for line in io.lines(input) do
+            local parts = line:split("\t")
+            if #parts >= 4 and tonumber(parts[1], 16) then
+                local name = parts[4]:trim()
+                table.insert(lines, format(template, name, module_name, name))
+            end
+        end
+        io.writefile(output, table.concat(lines, "\n") .. "\n")
+    end)
+rule_end()
+
 target("hid")
     set_kind("shared")
     set_languages("c++17")
 
+    add_rules("export_forward")
     add_links("user32")
     add_packages("wil")
 